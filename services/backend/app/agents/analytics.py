@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import logging
 from pathlib import Path
 
@@ -17,9 +16,8 @@ async def _run(window_hours: int, output: Path | None) -> None:
     async with session_scope() as session:
         service = ProductAnalyticsService(session)
         summary = await service.summarize(window_hours=window_hours)
-        payload = summary.model_dump(mode="json")
 
-    formatted = json.dumps(payload, ensure_ascii=False, indent=2)
+    formatted = summary.model_dump_json(indent=2)
     if output:
         output.write_text(formatted, encoding="utf-8")
         logger.info("Wrote analytics summary to %s", output)
@@ -4,6 +4,7 @@ import argparse
 import asyncio
 import base64
 import csv
+import itertools
 import json
 import logging
 import pathlib
@@ -23,6 +24,9 @@ from app.core.config import AppSettings, get_settings
 
 logger = logging.getLogger("mindwell.data_sync")
 
+_CSV_READ_BUFFER = 1 << 20
+_FULLWIDTH_SEPARATORS = str.maketrans({"；": ";", "，": ","})
+
 
 class TherapistSource(Protocol):
     """Interface describing a therapist data source."""
@@ -95,9 +99,18 @@ class LocalFileSource:
                 raise ValueError(f"Unsupported JSON schema in {self.path}")
         elif suffix in {".csv", ".tsv"}:
             delimiter = "\t" if suffix == ".tsv" else ","
-            with self.path.open("r", encoding="utf-8", newline="") as handle:
-                reader = csv.DictReader(handle, delimiter=delimiter)
-                records = list(reader)
+            # Large read buffer + a single header list keep big exports cheap to parse.
+            with self.path.open(
+                "r", encoding="utf-8", newline="", buffering=_CSV_READ_BUFFER
+            ) as handle:
+                reader = csv.reader(handle, delimiter=delimiter)
+                header = next(reader, [])
+                # Pad short rows with None, matching csv.DictReader's restval.
+                records = [
+                    dict(zip(header, itertools.chain(row, itertools.repeat(None))))
+                    for row in reader
+                    if row
+                ]
         else:
             raise ValueError(f"Unsupported file format for {self.path}")
 
@@ -368,7 +381,7 @@ class DataSyncAgent:
         if value is None:
             return []
         if isinstance(value, str):
-            parts = [item.strip() for item in value.replace("；", ";").replace("，", ",").split(",")]
+            parts = [item.strip() for item in value.translate(_FULLWIDTH_SEPARATORS).split(",")]
             return [part for part in parts if part]
         if isinstance(value, Iterable):
             return [str(item) for item in value if item is not None]
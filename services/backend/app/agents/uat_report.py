@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -32,28 +31,25 @@ async def _generate_report(filters: PilotFeedbackFilters) -> PilotFeedbackReport
         return await service.summarize_feedback(filters)
 
 
-def _format_breakdown(title: str, mapping: dict[str, int]) -> str:
+def _format_breakdown(title: str, mapping: dict[str, int]) -> list[str]:
     lines = [f"### {title}"]
     if not mapping:
         lines.append("_No data available._")
-        return "\n".join(lines)
+        return lines
 
     lines.append("| Key | Count |")
     lines.append("| --- | ---: |")
-    for key, value in sorted(mapping.items(), key=lambda item: (-item[1], item[0])):
-        label = key or "unspecified"
-        lines.append(f"| {label} | {value} |")
-    return "\n".join(lines)
+    lines.extend(
+        f"| {key or 'unspecified'} | {value} |"
+        for key, value in sorted(mapping.items(), key=lambda item: (-item[1], item[0]))
+    )
+    return lines
 
 
 def _format_insights(
     title: str, entries: list[PilotFeedbackInsight], attribute: str
-) -> str:
+) -> list[str]:
     lines = [f"### {title}"]
-    if not entries:
-        lines.append("_No entries recorded._")
-        return "\n".join(lines)
-
     for entry in entries:
         value = getattr(entry, attribute)
         if not value:
@@ -65,11 +61,12 @@ def _format_insights(
         )
     if len(lines) == 1:
         lines.append("_No entries recorded._")
-    return "\n".join(lines)
+    return lines
 
 
 def _render_markdown(report: PilotFeedbackReport) -> str:
     scorecard = report.average_scores
+    tag_lines = [f"- {stat.tag} ({stat.count})" for stat in report.tag_frequency]
     lines = [
         "# Pilot Feedback Report",
         f"- Generated at: {report.generated_at.isoformat()}",
@@ -79,29 +76,21 @@ def _render_markdown(report: PilotFeedbackReport) -> str:
         f"- Avg usability: {scorecard.average_usability} (>=4: {scorecard.usability_success_rate}%)",
         f"- Follow-ups needed: {report.follow_up_required}",
         "",
-        _format_breakdown("Severity Breakdown", report.severity_breakdown),
+        *_format_breakdown("Severity Breakdown", report.severity_breakdown),
+        "",
+        *_format_breakdown("Channel Breakdown", report.channel_breakdown),
+        "",
+        *_format_breakdown("Role Breakdown", report.role_breakdown),
         "",
-        _format_breakdown("Channel Breakdown", report.channel_breakdown),
+        "### Top Tags",
+        *(tag_lines or ["_No tags recorded._"]),
         "",
-        _format_breakdown("Role Breakdown", report.role_breakdown),
+        *_format_insights("Recent Highlights", report.recent_highlights, "highlights"),
+        "",
+        *_format_insights(
+            "Blockers & Severity Calls", report.blocker_insights, "blockers"
+        ),
     ]
-
-    lines.append("")
-    lines.append("### Top Tags")
-    if not report.tag_frequency:
-        lines.append("_No tags recorded._")
-    else:
-        for stat in report.tag_frequency:
-            lines.append(f"- {stat.tag} ({stat.count})")
-
-    lines.extend(
-        [
-            "",
-            _format_insights("Recent Highlights", report.recent_highlights, "highlights"),
-            "",
-            _format_insights("Blockers & Severity Calls", report.blocker_insights, "blockers"),
-        ]
-    )
     return "\n".join(lines).strip() + "\n"
 
 
@@ -171,7 +160,7 @@ def main() -> None:
     filters = _build_filters(args)
     report = asyncio.run(_generate_report(filters))
     if args.format == "json":
-        content = json.dumps(report.model_dump(mode="json"), ensure_ascii=False, indent=2)
+        content = report.model_dump_json(indent=2)
     else:
         content = _render_markdown(report)
 
@@ -18,6 +18,12 @@ from app.core.config import get_settings
 from app.core.migrations import migrate_database
 
 
+_POSTGRES_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+}
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 logger = logging.getLogger(__name__)
@@ -70,6 +76,8 @@ def _init_engine() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
     engine_kwargs: dict[str, Any] = {"future": True}
     if connect_args:
         engine_kwargs["connect_args"] = connect_args
+    if make_url(database_url).get_backend_name() == "postgresql":
+        engine_kwargs.update(_POSTGRES_POOL_OPTIONS)
 
     engine = create_async_engine(database_url, **engine_kwargs)
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
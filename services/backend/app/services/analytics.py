@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AnalyticsEvent
@@ -50,6 +51,24 @@ class ProductAnalyticsService:
         )
         return AnalyticsEventResponse(id=record.id, created_at=record.created_at)
 
+    async def record_events_bulk(self, payloads: Sequence[AnalyticsEventCreate]) -> int:
+        """Persist many analytics events with a single multi-row INSERT."""
+        rows = [
+            self._to_row(
+                event_type=payload.event_type,
+                user_id=payload.user_id,
+                session_id=payload.session_id,
+                funnel_stage=payload.funnel_stage,
+                properties=payload.properties,
+                occurred_at=payload.occurred_at,
+            )
+            for payload in payloads
+        ]
+        if not rows:
+            return 0
+        await self._session.execute(insert(AnalyticsEvent), rows)
+        return len(rows)
+
     async def track_chat_turn(
         self,
         *,
@@ -238,19 +257,39 @@ class ProductAnalyticsService:
         properties: dict[str, Any] | None = None,
         occurred_at: datetime | None = None,
     ) -> AnalyticsEvent:
-        timestamp = self._normalize_datetime(occurred_at)
         record = AnalyticsEvent(
-            user_id=user_id,
-            session_id=session_id,
-            event_type=event_type,
-            funnel_stage=funnel_stage,
-            properties=properties or {},
-            occurred_at=timestamp,
+            **self._to_row(
+                event_type=event_type,
+                user_id=user_id,
+                session_id=session_id,
+                funnel_stage=funnel_stage,
+                properties=properties,
+                occurred_at=occurred_at,
+            )
         )
         self._session.add(record)
         await self._session.flush()
         return record
 
+    def _to_row(
+        self,
+        *,
+        event_type: str,
+        user_id: UUID | None,
+        session_id: UUID | None = None,
+        funnel_stage: str | None = None,
+        properties: dict[str, Any] | None = None,
+        occurred_at: datetime | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "session_id": session_id,
+            "event_type": event_type,
+            "funnel_stage": funnel_stage,
+            "properties": properties or {},
+            "occurred_at": self._normalize_datetime(occurred_at),
+        }
+
     async def _counts_by_event_type(self, *filters) -> dict[str, int]:
         stmt = (
             select(AnalyticsEvent.event_type, func.count())
@@ -7,7 +7,7 @@ from typing import Any, Protocol
 from uuid import UUID
 
 import aioboto3
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -280,31 +280,24 @@ class DataSubjectService:
             message.content = redaction_token
         messages_redacted = len(messages)
 
-        daily_stmt = select(DailySummary).where(DailySummary.user_id == user_id)
-        daily_summaries = (await self._session.execute(daily_stmt)).scalars().all()
-        daily_deleted = len(daily_summaries)
-        for summary in daily_summaries:
-            await self._session.delete(summary)
+        daily_result = await self._session.execute(
+            delete(DailySummary).where(DailySummary.user_id == user_id)
+        )
+        daily_deleted = daily_result.rowcount or 0
 
         weekly_deleted = 0
         try:
-            weekly_stmt = select(WeeklySummary).where(WeeklySummary.user_id == user_id)
-            weekly_summaries = (
-                await self._session.execute(weekly_stmt)
-            ).scalars().all()
-            weekly_deleted = len(weekly_summaries)
-            for summary in weekly_summaries:
-                await self._session.delete(summary)
+            weekly_result = await self._session.execute(
+                delete(WeeklySummary).where(WeeklySummary.user_id == user_id)
+            )
+            weekly_deleted = weekly_result.rowcount or 0
         except SQLAlchemyError as exc:  # pragma: no cover - sqlite fallback
             logger.debug("Skipping weekly summary deletion: %s", exc)
 
-        memories_stmt = select(ConversationMemory).where(
-            ConversationMemory.user_id == user_id
+        memories_result = await self._session.execute(
+            delete(ConversationMemory).where(ConversationMemory.user_id == user_id)
         )
-        memories = (await self._session.execute(memories_stmt)).scalars().all()
-        memories_deleted = len(memories)
-        for memory in memories:
-            await self._session.delete(memory)
+        memories_deleted = memories_result.rowcount or 0
 
         analytics_stmt = select(AnalyticsEvent).where(
             AnalyticsEvent.user_id == user_id
@@ -318,15 +311,10 @@ class DataSubjectService:
             props["anonymised_at"] = anonymised_at.isoformat()
             event.properties = props
 
-        refresh_tokens_stmt = (
-            select(RefreshToken).where(RefreshToken.user_id == user_id)
+        refresh_result = await self._session.execute(
+            delete(RefreshToken).where(RefreshToken.user_id == user_id)
         )
-        refresh_tokens = (
-            await self._session.execute(refresh_tokens_stmt)
-        ).scalars().all()
-        refresh_tokens_revoked = len(refresh_tokens)
-        for token in refresh_tokens:
-            await self._session.delete(token)
+        refresh_tokens_revoked = refresh_result.rowcount or 0
 
         login_stmt = select(LoginChallenge).where(LoginChallenge.user_id == user_id)
         login_challenges = (
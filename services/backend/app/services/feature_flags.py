@@ -15,6 +15,8 @@ from app.schemas.features import (
     FeatureFlagUpsert,
 )
 
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "on", "enabled"})
+
 
 class FeatureFlagService:
     """Manage runtime feature flags backed by the database with config defaults."""
@@ -151,8 +153,7 @@ class FeatureFlagService:
             return value
         if isinstance(value, (int, float)):
             return bool(value)
-        str_value = str(value).strip().lower()
-        return str_value in {"1", "true", "yes", "on", "enabled"}
+        return str(value).strip().lower() in _TRUE_TOKENS
 
     def _normalize_metadata(
         self,
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
+import uuid
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Any, Iterable
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import JSON, Select, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import PilotFeedback
@@ -28,30 +30,57 @@ class PilotFeedbackService:
 
     async def record_feedback(self, payload: PilotFeedbackCreate) -> PilotFeedbackItem:
         """Persist a pilot feedback entry and return the serialized record."""
-        normalized_tags = self._normalize_tags(payload.tags)
-        entry = PilotFeedback(
-            user_id=payload.user_id,
-            cohort=payload.cohort.strip(),
-            participant_alias=self._strip_or_none(payload.participant_alias),
-            contact_email=self._strip_or_none(payload.contact_email),
-            role=payload.role.strip(),
-            channel=payload.channel.strip(),
-            scenario=self._strip_or_none(payload.scenario),
-            sentiment_score=payload.sentiment_score,
-            trust_score=payload.trust_score,
-            usability_score=payload.usability_score,
-            severity=self._strip_or_none(payload.severity),
-            tags=normalized_tags,
-            highlights=self._strip_or_none(payload.highlights),
-            blockers=self._strip_or_none(payload.blockers),
-            follow_up_needed=payload.follow_up_needed,
-            metadata_json=payload.metadata or None,
-        )
+        entry = PilotFeedback(**self._to_row(payload))
         self._session.add(entry)
         await self._session.flush()
         await self._session.refresh(entry)
         return self._serialize(entry)
 
+    async def record_feedback_bulk(
+        self,
+        payloads: Iterable[PilotFeedbackCreate],
+        *,
+        use_copy: bool = True,
+    ) -> int:
+        """Insert many feedback entries via COPY on asyncpg, executemany elsewhere."""
+        rows = [self._to_row(payload) for payload in payloads]
+        if not rows:
+            return 0
+        if use_copy and self._session.get_bind().dialect.driver == "asyncpg":
+            await self._copy_rows(rows)
+        else:
+            await self._session.execute(insert(PilotFeedback), rows)
+        return len(rows)
+
+    async def _copy_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Stream rows through PostgreSQL COPY, bypassing per-statement overhead."""
+        keys = list(rows[0])
+        columns = [PilotFeedback.__mapper__.attrs[key].columns[0] for key in keys]
+        json_keys = {key for key, column in zip(keys, columns) if isinstance(column.type, JSON)}
+        records = [
+            (
+                uuid.uuid4(),
+                *(
+                    json.dumps(row[key], ensure_ascii=False)
+                    if key in json_keys and row[key] is not None
+                    else row[key]
+                    for key in keys
+                ),
+            )
+            for row in rows
+        ]
+
+        connection = await self._session.connection()
+        # The asyncpg adapter only emits BEGIN from its own execute path; without
+        # it COPY would autocommit on the raw connection and escape rollback.
+        await connection.exec_driver_sql("SELECT 1")
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            PilotFeedback.__tablename__,
+            records=records,
+            columns=[PilotFeedback.id.name, *(column.name for column in columns)],
+        )
+
     async def list_feedback(
         self,
         filters: PilotFeedbackFilters | None = None,
@@ -230,6 +259,28 @@ class PilotFeedbackService:
             blocker_insights=blocker_entries[:highlight_limit],
         )
 
+    @classmethod
+    def _to_row(cls, payload: PilotFeedbackCreate) -> dict[str, Any]:
+        return {
+            "user_id": payload.user_id,
+            "cohort": payload.cohort.strip(),
+            "participant_alias": cls._strip_or_none(payload.participant_alias),
+            "contact_email": cls._strip_or_none(payload.contact_email),
+            "role": payload.role.strip(),
+            "channel": payload.channel.strip(),
+            "scenario": cls._strip_or_none(payload.scenario),
+            "sentiment_score": payload.sentiment_score,
+            "trust_score": payload.trust_score,
+            "usability_score": payload.usability_score,
+            "severity": cls._strip_or_none(payload.severity),
+            "tags": cls._normalize_tags(payload.tags),
+            "highlights": cls._strip_or_none(payload.highlights),
+            "blockers": cls._strip_or_none(payload.blockers),
+            "follow_up_needed": payload.follow_up_needed,
+            "metadata_json": payload.metadata or None,
+            "submitted_at": datetime.now(timezone.utc),
+        }
+
     @staticmethod
     def _normalize_tags(tags: Iterable[str]) -> list[str]:
         normalized: list[str] = []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import re
@@ -211,10 +212,13 @@ requests
         return alerts
 
     async def evaluate(self) -> list[MetricAlert]:
-        latency = await self._check_latency()
-        error_rate = await self._check_error_rate()
-        cost = await self._check_cost()
-        return [latency, error_rate, cost]
+        # Guardrails hit independent providers, so run them concurrently.
+        alerts = await asyncio.gather(
+            self._check_latency(),
+            self._check_error_rate(),
+            self._check_cost(),
+        )
+        return list(alerts)
 
     def _record_metrics(self, alerts: Sequence[MetricAlert]) -> None:
         if not self._metrics_path:
@@ -65,16 +65,20 @@ async def main() -> int:
             )
         )
     else:
-        if not matches:
-            print("No users found.")
+        lines: list[str] = [] if matches else ["No users found."]
         for match in matches:
             payload = match.model_dump(by_alias=True)
-            print(f"- id: {payload['id']}")
-            print(f"  email: {payload.get('email')}")
-            print(f"  phone: {payload.get('phoneNumber')}")
-            print(f"  locale: {payload.get('locale')}")
-            print(f"  createdAt: {payload.get('createdAt')}")
-            print("")
+            lines.extend(
+                (
+                    f"- id: {payload['id']}",
+                    f"  email: {payload.get('email')}",
+                    f"  phone: {payload.get('phoneNumber')}",
+                    f"  locale: {payload.get('locale')}",
+                    f"  createdAt: {payload.get('createdAt')}",
+                    "",
+                )
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
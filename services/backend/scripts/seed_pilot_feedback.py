@@ -4,17 +4,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import itertools
 import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session_factory
 from app.models import PilotFeedback
 from app.schemas.feedback import PilotFeedbackCreate
 from app.services.feedback import PilotFeedbackService
 
+try:  # Optional: stream large fixtures instead of loading the whole array.
+    import ijson
+except ImportError:  # pragma: no cover - exercised when ijson is absent
+    ijson = None
+
+_QUEUE_DEPTH = 4
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -35,6 +46,17 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Delete existing feedback rows for the targeted cohort(s) before inserting.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of feedback rows inserted per executemany round-trip (default: 1000).",
+    )
+    parser.add_argument(
+        "--trusted",
+        action="store_true",
+        help="Skip schema validation for fixtures that are known to be well-formed.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -43,47 +65,106 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _load_entries(path: Path) -> list[dict[str, Any]]:
+def _load_entries(path: Path) -> Iterator[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Feedback fixture not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(data, list):
+    if ijson is None:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, list):
+            raise ValueError("Feedback fixture must be a JSON array.")
+        return iter(data)
+    return _stream_entries(path)
+
+
+def _stream_entries(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield fixture entries one at a time so memory stays bounded by the batch size."""
+    handle = path.open("rb")
+    events = ijson.parse(handle, use_float=True)
+    # Check the top-level token up front so both loaders reject non-arrays eagerly.
+    first = next(events, None)
+    if first is None or first[1] != "start_array":
+        handle.close()
         raise ValueError("Feedback fixture must be a JSON array.")
-    return data
+    return _iter_items(handle, itertools.chain([first], events))
+
+
+def _iter_items(
+    handle: BinaryIO, events: Iterator[tuple[str, str, Any]]
+) -> Iterator[dict[str, Any]]:
+    with handle:
+        yield from ijson.items(events, "item")
+
+
+@dataclass(slots=True)
+class _SeedBatch:
+    payloads: list[PilotFeedbackCreate] = field(default_factory=list)
+    purge: list[str] = field(default_factory=list)
+
+
+async def _purge_cohort(session: AsyncSession, cohort: str) -> int:
+    result = await session.execute(delete(PilotFeedback).where(PilotFeedback.cohort == cohort))
+    return result.rowcount or 0
 
 
 async def _apply_seed(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
     *,
     cohort_filter: str | None,
     replace: bool,
     dry_run: bool,
+    batch_size: int = 1000,
+    trusted: bool = False,
 ) -> tuple[int, int]:
     session_factory = get_session_factory()
     inserted = 0
     deleted = 0
 
-    async with session_factory() as session:
-        service = PilotFeedbackService(session)
-        cohorts = {entry.get("cohort") for entry in entries if entry.get("cohort")}
-
-        if replace:
-            target_cohorts = [cohort_filter] if cohort_filter else cohorts
-            for cohort in target_cohorts:
-                if not cohort:
-                    continue
-                result = await session.execute(
-                    delete(PilotFeedback).where(PilotFeedback.cohort == cohort)
-                )
-                deleted += result.rowcount or 0
+    build_payload = PilotFeedbackCreate.model_construct if trusted else PilotFeedbackCreate
+    # Validated batches are handed to the writer through a bounded queue so
+    # payload validation overlaps with the database round-trips.
+    queue: asyncio.Queue[_SeedBatch | None] = asyncio.Queue(maxsize=_QUEUE_DEPTH)
 
+    async def produce() -> None:
+        # Cohorts are purged the first time they appear so entries can be streamed.
+        seen: set[str] = {cohort_filter} if replace and cohort_filter else set()
+        batch = _SeedBatch()
         for entry in entries:
             cohort = entry.get("cohort")
             if cohort_filter and cohort != cohort_filter:
                 continue
-            payload = PilotFeedbackCreate(**entry)
-            await service.record_feedback(payload)
-            inserted += 1
+            if replace and cohort and cohort not in seen:
+                seen.add(cohort)
+                batch.purge.append(cohort)
+            batch.payloads.append(build_payload(**entry))
+            if len(batch.payloads) >= batch_size:
+                await queue.put(batch)
+                batch = _SeedBatch()
+        await queue.put(batch)
+        await queue.put(None)
+
+    async with session_factory() as session:
+        service = PilotFeedbackService(session)
+
+        async def consume() -> None:
+            nonlocal inserted, deleted
+            while (batch := await queue.get()) is not None:
+                for cohort in batch.purge:
+                    deleted += await _purge_cohort(session, cohort)
+                inserted += await service.record_feedback_bulk(
+                    batch.payloads, use_copy=not dry_run
+                )
+
+        if replace and cohort_filter:
+            deleted += await _purge_cohort(session, cohort_filter)
+
+        tasks = [asyncio.create_task(produce()), asyncio.create_task(consume())]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         if dry_run:
             await session.rollback()
@@ -101,6 +182,8 @@ async def _main() -> int:
         cohort_filter=args.cohort,
         replace=args.replace,
         dry_run=args.dry_run,
+        batch_size=max(1, args.batch_size),
+        trusted=args.trusted,
     )
     action = "validated" if args.dry_run else "inserted"
     print(
@@ -6,18 +6,18 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.models.entities import AnalyticsEvent, ChatSession, User
+from app.models import Base
 from app.schemas.analytics import AnalyticsEventCreate
 from app.services.analytics import AnalyticsEventType, ProductAnalyticsService
 
+CUSTOM_EVENT = AnalyticsEventCreate(event_type="custom-event", properties={"foo": "bar"})
+
 
 @pytest_asyncio.fixture()
 async def analytics_session() -> AsyncSession:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
-        await conn.run_sync(User.__table__.create)
-        await conn.run_sync(ChatSession.__table__.create)
-        await conn.run_sync(AnalyticsEvent.__table__.create)
+        await conn.run_sync(Base.metadata.create_all)
 
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_factory() as session:
@@ -29,9 +29,7 @@ async def analytics_session() -> AsyncSession:
 @pytest.mark.asyncio
 async def test_record_event_stores_payload(analytics_session: AsyncSession) -> None:
     service = ProductAnalyticsService(analytics_session)
-    payload = AnalyticsEventCreate(event_type="custom-event", properties={"foo": "bar"})
-
-    response = await service.record_event(payload)
+    response = await service.record_event(CUSTOM_EVENT)
 
     assert response.id is not None
 
@@ -88,14 +86,20 @@ async def test_locale_breakdown_sorts_and_limits_results(analytics_session: Asyn
     session = uuid4()
 
     locales = ["zh-CN", "zh-TW", "en-US", "fr-FR", "ja-JP", "ko-KR"]
+    chat_turns = [
+        AnalyticsEventCreate(
+            event_type=AnalyticsEventType.CHAT_TURN_SENT.value,
+            user_id=user,
+            session_id=session,
+            funnel_stage="engagement",
+            properties={"locale": locale, "message_length": 10},
+        )
+        for idx, locale in enumerate(locales, start=1)
+        for _ in range(idx)
+    ]
+    assert await service.record_events_bulk(chat_turns) == len(chat_turns)
+
     for idx, locale in enumerate(locales, start=1):
-        for _ in range(idx):
-            await service.track_chat_turn(
-                user_id=user,
-                session_id=session,
-                locale=locale,
-                message_length=10,
-            )
         if idx % 2 == 0:
             await service.track_therapist_profile_view(user_id=user, therapist_id=None, locale=locale)
         if idx % 3 == 0:
@@ -1,12 +1,15 @@
+import pytest
 from fastapi.testclient import TestClient
 
 from app.core.app import create_app
 
 
-def test_healthcheck_returns_ok() -> None:
-    app = create_app()
-    client = TestClient(app)
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    return TestClient(create_app())
 
+
+def test_healthcheck_returns_ok(client: TestClient) -> None:
     response = client.get("/api/healthz")
     assert response.status_code == 200
     payload = response.json()
@@ -9,11 +9,20 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import AppSettings
+from app.models import Base
 from app.models.entities import RefreshToken, User
 from app.schemas.auth import DemoLoginRequest, TokenRefreshRequest
 from app.services.auth import AuthService, OAuth2Identity
 from app.services.demo_codes import DemoCodeEntry
 
+USERS_STMT = select(User)
+REFRESH_TOKENS_STMT = select(RefreshToken)
+BASE_SETTINGS = AppSettings(
+    JWT_SECRET_KEY="unit-test-secret",
+    ACCESS_TOKEN_TTL=120,
+    REFRESH_TOKEN_TTL=3600,
+)
+
 
 class StubDemoRegistry:
     """In-memory registry used in unit tests."""
@@ -34,15 +43,7 @@ class StubDemoRegistry:
         if not code:
             return None
         normalized = code.strip()
-        if not normalized:
-            return None
-        direct = self._entries.get(normalized)
-        if direct:
-            return direct
-        lowered = normalized.casefold()
-        if lowered in self._fallback:
-            return self._fallback[lowered]
-        return None
+        return self._entries.get(normalized) or self._fallback.get(normalized.casefold())
 
 
 @pytest_asyncio.fixture()
@@ -50,8 +51,7 @@ async def auth_session() -> AsyncSession:
     """Provide an isolated in-memory database session for auth tests."""
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
-        await conn.run_sync(User.__table__.create)
-        await conn.run_sync(RefreshToken.__table__.create)
+        await conn.run_sync(Base.metadata.create_all)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
     async with session_factory() as session:
@@ -60,6 +60,14 @@ async def auth_session() -> AsyncSession:
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Pin AuthService's clock so token timestamps are deterministic."""
+    now = datetime.now(timezone.utc)
+    monkeypatch.setattr(AuthService, "_now", lambda self: now)
+    return now
+
+
 def make_auth_service(
     session: AsyncSession,
     registry: StubDemoRegistry,
@@ -67,12 +75,11 @@ def make_auth_service(
     default_chat_quota: int = 50,
     demo_chat_quota: int = 10,
 ) -> AuthService:
-    settings = AppSettings(
-        JWT_SECRET_KEY="unit-test-secret",
-        ACCESS_TOKEN_TTL=120,
-        REFRESH_TOKEN_TTL=3600,
-        CHAT_TOKEN_DEFAULT_QUOTA=default_chat_quota,
-        CHAT_TOKEN_DEMO_QUOTA=demo_chat_quota,
+    settings = BASE_SETTINGS.model_copy(
+        update={
+            "chat_token_default_quota": default_chat_quota,
+            "chat_token_demo_quota": demo_chat_quota,
+        }
     )
     return AuthService(session=session, settings=settings, demo_registry=registry)
 
@@ -80,20 +87,17 @@ def make_auth_service(
 @pytest.mark.asyncio
 async def test_create_session_from_oauth_creates_user_and_tokens(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry()
     service = make_auth_service(auth_session, registry)
 
-    monkeypatch.setattr(AuthService, "_now", lambda self: datetime.now(timezone.utc))
-
     identity = OAuth2Identity(subject="azure-ad:123", email="user@example.com", name="Test User")
     tokens = await service.create_session_from_oauth(identity, session_id="sess-1")
 
     assert tokens.access_token
     assert tokens.refresh_token
 
-    users_result = await auth_session.execute(select(User))
+    users_result = await auth_session.execute(USERS_STMT)
     users = users_result.scalars().all()
     assert len(users) == 1
     assert users[0].email == "user@example.com"
@@ -101,7 +105,7 @@ async def test_create_session_from_oauth_creates_user_and_tokens(
     assert users[0].chat_token_quota == 50
     assert users[0].chat_tokens_remaining == 50
 
-    refresh_result = await auth_session.execute(select(RefreshToken))
+    refresh_result = await auth_session.execute(REFRESH_TOKENS_STMT)
     refresh_tokens = refresh_result.scalars().all()
     assert len(refresh_tokens) == 1
     assert refresh_tokens[0].revoked_at is None
@@ -110,7 +114,6 @@ async def test_create_session_from_oauth_creates_user_and_tokens(
 @pytest.mark.asyncio
 async def test_login_with_demo_code_honours_allowlist(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry(
         [
@@ -123,14 +126,12 @@ async def test_login_with_demo_code_honours_allowlist(
     )
     service = make_auth_service(auth_session, registry, demo_chat_quota=5)
 
-    monkeypatch.setattr(AuthService, "_now", lambda self: datetime.now(timezone.utc))
-
     payload = DemoLoginRequest(code="demo-42")
     tokens = await service.login_with_demo_code(payload, user_agent="pytest")
 
     assert tokens.access_token
 
-    users_result = await auth_session.execute(select(User))
+    users_result = await auth_session.execute(USERS_STMT)
     user = users_result.scalar_one()
     assert user.account_type == "demo"
     assert user.demo_code == "DEMO-42"
@@ -141,7 +142,6 @@ async def test_login_with_demo_code_honours_allowlist(
 @pytest.mark.asyncio
 async def test_demo_code_accounts_are_isolated(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry(
         [
@@ -159,13 +159,10 @@ async def test_demo_code_accounts_are_isolated(
     )
     service = make_auth_service(auth_session, registry, demo_chat_quota=5)
 
-    now = datetime.now(timezone.utc)
-    monkeypatch.setattr(AuthService, "_now", lambda self: now)
-
     await service.login_with_demo_code(DemoLoginRequest(code="TEAM-ALPHA"))
     await service.login_with_demo_code(DemoLoginRequest(code="Team Alpha"))
 
-    users_result = await auth_session.execute(select(User))
+    users_result = await auth_session.execute(USERS_STMT)
     users = users_result.scalars().all()
     assert len(users) == 2
     assert {user.account_type for user in users} == {"demo"}
@@ -177,19 +174,15 @@ async def test_demo_code_accounts_are_isolated(
 @pytest.mark.asyncio
 async def test_multiple_oauth_sessions_allowed(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry()
     service = make_auth_service(auth_session, registry)
 
-    now = datetime.now(timezone.utc)
-    monkeypatch.setattr(AuthService, "_now", lambda self: now)
-
     identity = OAuth2Identity(subject="id-1", email="limit@example.com", name=None)
     await service.create_session_from_oauth(identity)
     await service.create_session_from_oauth(identity)
 
-    tokens_result = await auth_session.execute(select(RefreshToken))
+    tokens_result = await auth_session.execute(REFRESH_TOKENS_STMT)
     tokens = tokens_result.scalars().all()
     assert len(tokens) == 2
     assert all(token.revoked_at is None for token in tokens)
@@ -198,18 +191,14 @@ async def test_multiple_oauth_sessions_allowed(
 @pytest.mark.asyncio
 async def test_oauth_login_preserves_chat_tokens_when_exhausted(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry()
     service = make_auth_service(auth_session, registry, default_chat_quota=3)
 
-    now = datetime.now(timezone.utc)
-    monkeypatch.setattr(AuthService, "_now", lambda self: now)
-
     identity = OAuth2Identity(subject="quota-user", email="quota@example.com", name=None)
     await service.create_session_from_oauth(identity)
 
-    user_result = await auth_session.execute(select(User))
+    user_result = await auth_session.execute(USERS_STMT)
     user = user_result.scalar_one()
     assert user.chat_tokens_remaining == 3
 
@@ -218,7 +207,7 @@ async def test_oauth_login_preserves_chat_tokens_when_exhausted(
 
     await service.create_session_from_oauth(identity, session_id="second")
 
-    refreshed_user = (await auth_session.execute(select(User))).scalar_one()
+    refreshed_user = (await auth_session.execute(USERS_STMT)).scalar_one()
     assert refreshed_user.chat_token_quota == 3
     assert refreshed_user.chat_tokens_remaining == 0
 
@@ -226,14 +215,10 @@ async def test_oauth_login_preserves_chat_tokens_when_exhausted(
 @pytest.mark.asyncio
 async def test_refresh_token_revokes_previous_token(
     auth_session: AsyncSession,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     registry = StubDemoRegistry()
     service = make_auth_service(auth_session, registry)
 
-    now = datetime.now(timezone.utc)
-    monkeypatch.setattr(AuthService, "_now", lambda self: now)
-
     identity = OAuth2Identity(subject="refresh-1", email="refresh@example.com", name=None)
     tokens = await service.create_session_from_oauth(identity)
 
@@ -242,7 +227,7 @@ async def test_refresh_token_revokes_previous_token(
 
     assert refreshed.access_token != tokens.access_token
 
-    token_rows = await auth_session.execute(select(RefreshToken))
+    token_rows = await auth_session.execute(REFRESH_TOKENS_STMT)
     all_tokens = token_rows.scalars().all()
     assert len(all_tokens) == 2
     revoked = [token for token in all_tokens if token.revoked_at is not None]
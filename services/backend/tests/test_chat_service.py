@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+from dataclasses import dataclass
 from uuid import UUID, uuid4
 
 import pytest
@@ -8,11 +8,14 @@ import pytest_asyncio
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.models.entities import ChatMessage, ChatSession, User
+from app.models import Base
+from app.models.entities import ChatMessage, User
 from app.schemas.chat import ChatRequest
 from app.schemas.therapists import TherapistRecommendation
 from app.services.chat import ChatService, TokenQuotaExceeded
 
+CHAT_MESSAGES_STMT = select(ChatMessage)
+
 
 class StubOrchestrator:
     """Deterministic orchestrator used for unit tests."""
@@ -63,13 +66,19 @@ class StubTranscriptStorage:
         return "transcripts/test.json"
 
 
+@dataclass(slots=True, frozen=True)
+class StubMemory:
+    summary: str
+    keywords: tuple[str, ...]
+
+
 class StubMemoryService:
     def __init__(self) -> None:
         self.captured: list[dict[str, object]] = []
 
     async def list_memories(self, user_id, *, limit: int = 5):
         return [
-            SimpleNamespace(summary="最近关注焦虑管理。", keywords=["焦虑", "压力"]),
+            StubMemory(summary="最近关注焦虑管理。", keywords=("焦虑", "压力")),
         ]
 
     async def capture(self, **kwargs):
@@ -99,9 +108,7 @@ class StubRecommendationService:
 async def chat_session() -> AsyncSession:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
-        await conn.run_sync(User.__table__.create)
-        await conn.run_sync(ChatSession.__table__.create)
-        await conn.run_sync(ChatMessage.__table__.create)
+        await conn.run_sync(Base.metadata.create_all)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
@@ -134,9 +141,7 @@ async def test_stream_turn_emits_events_and_persists_transcript(chat_session: As
         enable_streaming=True,
     )
 
-    events = []
-    async for event in service.stream_turn(payload):
-        events.append(event)
+    events = [event async for event in service.stream_turn(payload)]
 
     assert events, "Expected at least one SSE event."
     assert events[0]["event"] == "session_established"
@@ -162,7 +167,7 @@ async def test_stream_turn_emits_events_and_persists_transcript(chat_session: As
     assert memory.captured
 
     # Verify chat messages were stored in the database for historical replay.
-    db_messages = await chat_session.execute(select(ChatMessage))
+    db_messages = await chat_session.execute(CHAT_MESSAGES_STMT)
     stored = db_messages.scalars().all()
     assert len(stored) == 2
 
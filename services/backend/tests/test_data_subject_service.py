@@ -12,6 +12,7 @@ from sqlalchemy.sql.sqltypes import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import AppSettings
+from app.models import Base
 from app.models.entities import (
     AnalyticsEvent,
     ChatMessage,
@@ -24,6 +25,8 @@ from app.models.entities import (
 )
 from app.services.data_subject import DataSubjectService, StorageRetentionClient
 
+ANALYTICS_EVENTS_STMT = select(AnalyticsEvent)
+
 
 class RecordingStorage(StorageRetentionClient):
     def __init__(self, transcript_objects: int = 0, summary_objects: int = 0) -> None:
@@ -45,14 +48,7 @@ class RecordingStorage(StorageRetentionClient):
 async def sar_session() -> AsyncSession:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
-        await conn.run_sync(User.__table__.create)
-        await conn.run_sync(ChatSession.__table__.create)
-        await conn.run_sync(ChatMessage.__table__.create)
-        await conn.run_sync(DailySummary.__table__.create)
-        await conn.run_sync(ConversationMemory.__table__.create)
-        await conn.run_sync(RefreshToken.__table__.create)
-        await conn.run_sync(AnalyticsEvent.__table__.create)
-        await conn.run_sync(LoginChallenge.__table__.create)
+        await conn.run_sync(Base.metadata.create_all)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
     async with session_factory() as session:
@@ -148,6 +144,7 @@ async def test_delete_user_data_redacts_and_revokes_records(sar_session: AsyncSe
     storage = RecordingStorage(transcript_objects=5, summary_objects=3)
     service, storage_client = make_service(sar_session, storage=storage)
 
+    now = datetime.now(tz=timezone.utc)
     user_id = uuid4()
     user = User(
         id=user_id,
@@ -176,51 +173,41 @@ async def test_delete_user_data_redacts_and_revokes_records(sar_session: AsyncSe
                 content="原始内容2",
                 sequence_index=1,
             ),
+            DailySummary(
+                user_id=user_id,
+                summary_date=now.date() - timedelta(days=1),
+                title="旧总结",
+                spotlight="注意休息",
+                summary="测试总结内容",
+                mood_delta=0,
+            ),
+            ConversationMemory(
+                user_id=user_id,
+                session_id=session.id,
+                keywords=["测试"],
+                summary="历史记忆",
+                last_message_at=now,
+            ),
+            AnalyticsEvent(
+                user_id=user_id,
+                session_id=session.id,
+                event_type="chat_turn_submitted",
+                properties={"turn": 1},
+            ),
+            RefreshToken(
+                user_id=user_id,
+                token_hash="token-hash",
+                expires_at=now + timedelta(days=30),
+            ),
+            LoginChallenge(
+                user_id=user_id,
+                provider="sms",
+                phone_number="+8618888888888",
+                code_hash="code",
+                expires_at=now + timedelta(minutes=5),
+            ),
         ]
     )
-    sar_session.add(
-        DailySummary(
-            user_id=user_id,
-            summary_date=date.today() - timedelta(days=1),
-            title="旧总结",
-            spotlight="注意休息",
-            summary="测试总结内容",
-            mood_delta=0,
-        )
-    )
-    sar_session.add(
-        ConversationMemory(
-            user_id=user_id,
-            session_id=session.id,
-            keywords=["测试"],
-            summary="历史记忆",
-            last_message_at=datetime.now(tz=timezone.utc),
-        )
-    )
-    sar_session.add(
-        AnalyticsEvent(
-            user_id=user_id,
-            session_id=session.id,
-            event_type="chat_turn_submitted",
-            properties={"turn": 1},
-        )
-    )
-    sar_session.add(
-        RefreshToken(
-            user_id=user_id,
-            token_hash="token-hash",
-            expires_at=datetime.now(tz=timezone.utc) + timedelta(days=30),
-        )
-    )
-    sar_session.add(
-        LoginChallenge(
-            user_id=user_id,
-            provider="sms",
-            phone_number="+8618888888888",
-            code_hash="code",
-            expires_at=datetime.now(tz=timezone.utc) + timedelta(minutes=5),
-        )
-    )
     await sar_session.commit()
 
     report = await service.delete_user_data(user_id, redaction_token="[removed]")
@@ -278,7 +265,7 @@ async def test_delete_user_data_redacts_and_revokes_records(sar_session: AsyncSe
     assert remaining_tokens == []
 
     anonymised_event = (
-        await sar_session.execute(select(AnalyticsEvent))
+        await sar_session.execute(ANALYTICS_EVENTS_STMT)
     ).scalars().first()
     assert anonymised_event is not None
     assert anonymised_event.user_id is None
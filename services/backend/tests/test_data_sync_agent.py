@@ -6,10 +6,37 @@ from contextlib import asynccontextmanager
 
 import pytest
 
-from app.agents.data_sync import DataSyncAgent, SecretMirrorMapping, SyncResult
+from app.agents.data_sync import (
+    DataSyncAgent,
+    LocalFileSource,
+    SecretMirrorMapping,
+    SyncResult,
+)
 from app.core.config import AppSettings
 
 
+THERAPIST_RECORDS: tuple[dict[str, object], ...] = (
+    {
+        "id": "therapist-001",
+        "name": "刘心语",
+        "specialties": ["焦虑管理", "认知行为疗法"],
+        "languages": ["zh-CN"],
+        "price_per_session": "680",
+        "currency": "cny",
+        "locale": "zh-CN",
+        "profile_image_url": "https://example.com/avatar.jpg",
+    },
+    {
+        "name": "Jane Doe",
+        "languages": "en-US,zh-CN",
+        "specialties": "Anxiety, Depression",
+        "price": 520,
+        "featured": True,
+        "locale": "en-US",
+    },
+)
+
+
 class StubSource:
     """Test double returning canned therapist payloads."""
 
@@ -96,28 +123,7 @@ def build_secret_factory(
 async def test_data_sync_agent_writes_normalized_profiles() -> None:
     calls: list[dict[str, object]] = []
     agent = build_agent(calls)
-    source = StubSource(
-        records=[
-            {
-                "id": "therapist-001",
-                "name": "刘心语",
-                "specialties": ["焦虑管理", "认知行为疗法"],
-                "languages": ["zh-CN"],
-                "price_per_session": "680",
-                "currency": "cny",
-                "locale": "zh-CN",
-                "profile_image_url": "https://example.com/avatar.jpg",
-            },
-            {
-                "name": "Jane Doe",
-                "languages": "en-US,zh-CN",
-                "specialties": "Anxiety, Depression",
-                "price": 520,
-                "featured": True,
-                "locale": "en-US",
-            },
-        ]
-    )
+    source = StubSource(records=list(THERAPIST_RECORDS))
 
     result = await agent.run([source], dry_run=False, prefix="therapists")
 
@@ -158,6 +164,23 @@ async def test_data_sync_agent_dry_run_skips_uploads() -> None:
     assert calls == []
 
 
+@pytest.mark.asyncio
+async def test_local_file_source_reads_csv_rows(tmp_path) -> None:
+    path = tmp_path / "therapists.csv"
+    path.write_text(
+        "name,specialties,locale\n刘心语,焦虑管理,zh-CN\n\nJane Doe,Anxiety,\nLi Wei,Sleep\n",
+        encoding="utf-8",
+    )
+
+    records = await LocalFileSource(path=path, locale="zh-TW").fetch()
+
+    assert records == [
+        {"name": "刘心语", "specialties": "焦虑管理", "locale": "zh-CN"},
+        {"name": "Jane Doe", "specialties": "Anxiety", "locale": ""},
+        {"name": "Li Wei", "specialties": "Sleep", "locale": None},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_mirror_secrets_updates_key_vault() -> None:
     calls: list[dict[str, str]] = []
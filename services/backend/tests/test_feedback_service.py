@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
 
 import pytest
 import pytest_asyncio
@@ -54,6 +57,100 @@ async def test_record_feedback_normalizes_tags(feedback_session: AsyncSession) -
     assert entry.metadata == {"device": "iPhone 12"}
 
 
+@pytest.mark.asyncio
+async def test_record_feedback_bulk_inserts_normalized_rows(
+    feedback_session: AsyncSession,
+) -> None:
+    service = PilotFeedbackService(feedback_session)
+    payloads = [
+        PilotFeedbackCreate(
+            cohort=" pilot-2025w4 ",
+            channel="web",
+            role="participant",
+            tags=["Latency", "latency ", ""],
+        ),
+        PilotFeedbackCreate(
+            cohort="pilot-2025w4",
+            channel=" mobile",
+            role="therapist",
+            metadata={"device": "Pixel 8"},
+        ),
+    ]
+
+    inserted = await service.record_feedback_bulk(payloads)
+    listing = await service.list_feedback(PilotFeedbackFilters(cohort="pilot-2025w4"))
+
+    assert inserted == 2
+    assert await service.record_feedback_bulk([]) == 0
+    assert listing.total == 2
+    by_channel = {item.channel: item for item in listing.items}
+    assert by_channel["web"].tags == ["Latency"]
+    assert by_channel["mobile"].metadata == {"device": "Pixel 8"}
+    assert all(item.id is not None for item in listing.items)
+
+
+class CopyRecordingSession:
+    """Minimal AsyncSession stand-in exposing an asyncpg-style raw connection."""
+
+    def __init__(self) -> None:
+        self.copies: list[dict[str, object]] = []
+        self.executed: list[object] = []
+        self.in_transaction = False
+
+    def get_bind(self) -> SimpleNamespace:
+        return SimpleNamespace(dialect=SimpleNamespace(driver="asyncpg"))
+
+    async def connection(self) -> "CopyRecordingSession":
+        return self
+
+    async def execute(self, statement, params=None) -> None:
+        self.in_transaction = True
+        self.executed.append(statement)
+
+    async def exec_driver_sql(self, statement: str) -> None:
+        self.in_transaction = True
+        self.executed.append(statement)
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_records_to_table(self, table: str, *, records, columns) -> None:
+        if not self.in_transaction:
+            raise AssertionError("COPY issued before a transaction was opened")
+        self.copies.append({"table": table, "records": list(records), "columns": columns})
+
+
+@pytest.mark.asyncio
+async def test_record_feedback_bulk_uses_copy_on_asyncpg() -> None:
+    session = CopyRecordingSession()
+    service = PilotFeedbackService(session)  # type: ignore[arg-type]
+
+    inserted = await service.record_feedback_bulk(
+        [
+            PilotFeedbackCreate(
+                cohort="pilot-2025w4",
+                tags=["语音", "voice"],
+                metadata={"device": "Pixel 8"},
+            ),
+            PilotFeedbackCreate(cohort="pilot-2025w4"),
+        ]
+    )
+
+    assert inserted == 2
+    [copy] = session.copies
+    assert copy["table"] == "pilot_feedback"
+    columns = copy["columns"]
+    assert columns[0] == "id"
+    assert "metadata" in columns and "metadata_json" not in columns
+    first, second = (dict(zip(columns, record)) for record in copy["records"])
+    assert isinstance(first["id"], UUID)
+    assert first["tags"] == json.dumps(["语音", "voice"], ensure_ascii=False)
+    assert first["metadata"] == '{"device": "Pixel 8"}'
+    assert second["tags"] == "[]"
+    assert second["metadata"] is None
+    assert first["submitted_at"].tzinfo is timezone.utc
+
+
 @pytest.mark.asyncio
 async def test_list_feedback_filters_results(feedback_session: AsyncSession) -> None:
     service = PilotFeedbackService(feedback_session)
@@ -189,3 +286,17 @@ async def test_summarize_feedback_respects_date_filters(feedback_session: AsyncS
 
     assert report.total_entries == 1
     assert report.tag_frequency[0].tag == "latency"
+
+
+@pytest.mark.asyncio
+async def test_record_feedback_bulk_skips_copy_when_disabled() -> None:
+    session = CopyRecordingSession()
+    service = PilotFeedbackService(session)  # type: ignore[arg-type]
+
+    inserted = await service.record_feedback_bulk(
+        [PilotFeedbackCreate(cohort="pilot-2025w4")], use_copy=False
+    )
+
+    assert inserted == 1
+    assert session.copies == []
+    assert len(session.executed) == 1
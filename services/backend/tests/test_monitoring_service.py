@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from datetime import date
@@ -49,6 +50,22 @@ class FakeCostClient:
         return self.value
 
 
+class ConcurrencyProbeClient(FakeAppInsightsClient):
+    """Blocks each query until both App Insights probes are in flight."""
+
+    def __init__(self, latency_ms: float, error_rate: float) -> None:
+        super().__init__(latency_ms=latency_ms, error_rate=error_rate)
+        self.in_flight = 0
+        self.both_started = asyncio.Event()
+
+    async def query(self, query: str, *, timespan: str = "PT5M") -> dict:
+        self.in_flight += 1
+        if self.in_flight == 2:
+            self.both_started.set()
+        await asyncio.wait_for(self.both_started.wait(), timeout=1.0)
+        return await super().query(query, timespan=timespan)
+
+
 class RecordingDispatcher:
     def __init__(self) -> None:
         self.dispatched: list[list[MetricAlert]] = []
@@ -192,3 +209,32 @@ async def test_monitoring_service_records_metrics_file(tmp_path) -> None:
 
     dir_payload_path = metrics_dir / "monitoring_metrics.json"
     assert dir_payload_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_monitoring_service_runs_checks_concurrently() -> None:
+    settings = AppSettings(
+        APP_ENV="test",
+        MONITORING_LATENCY_THRESHOLD_MS=1000.0,
+        MONITORING_ERROR_RATE_THRESHOLD=0.02,
+        MONITORING_COST_THRESHOLD_USD=200.0,
+        MONITORING_COST_LOOKBACK_DAYS=1,
+        AWS_REGION="us-east-1",
+    )
+    client = ConcurrencyProbeClient(latency_ms=800.0, error_rate=0.01)
+    service = MonitoringService(
+        settings,
+        app_insights_client=client,
+        cost_client=FakeCostClient(value=150.0),
+        alert_dispatcher=RecordingDispatcher(),
+    )
+
+    alerts = await service.evaluate()
+
+    assert client.both_started.is_set()
+    assert [alert.metric for alert in alerts] == [
+        "latency_p95_ms",
+        "error_rate",
+        "cloud_cost_usd",
+    ]
+    assert {alert.status for alert in alerts} == {"ok"}
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.entities import PilotFeedback, User
+from app.services.feedback import PilotFeedbackService
+from scripts import seed_pilot_feedback
+
+
+@pytest.fixture(params=["ijson", "stdlib"])
+def loader(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "ijson":
+        monkeypatch.setattr(seed_pilot_feedback, "ijson", pytest.importorskip("ijson"))
+    else:
+        monkeypatch.setattr(seed_pilot_feedback, "ijson", None)
+    return request.param
+
+
+def test_load_entries_reads_array(loader: str, tmp_path: Path) -> None:
+    fixture = tmp_path / "feedback.json"
+    entries = [
+        {"cohort": "pilot-2025w4", "sentiment_score": 4, "metadata": {"latency": 1.5}},
+        {"cohort": "pilot-2025w5", "tags": ["语音"]},
+    ]
+    fixture.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+
+    loaded = seed_pilot_feedback._load_entries(fixture)
+
+    assert list(loaded) == entries
+
+
+def test_load_entries_rejects_non_array(loader: str, tmp_path: Path) -> None:
+    fixture = tmp_path / "feedback.json"
+    fixture.write_text(json.dumps({"cohort": "pilot-2025w4"}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="must be a JSON array"):
+        seed_pilot_feedback._load_entries(fixture)
+
+
+def test_load_entries_requires_existing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        seed_pilot_feedback._load_entries(tmp_path / "missing.json")
+
+
+@pytest_asyncio.fixture()
+async def seed_session_factory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> async_sessionmaker[AsyncSession]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'seed.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+        await conn.run_sync(PilotFeedback.__table__.create)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(seed_pilot_feedback, "get_session_factory", lambda: session_factory)
+    yield session_factory
+
+    await engine.dispose()
+
+
+async def _cohort_counts(session_factory: async_sessionmaker[AsyncSession]) -> dict[str, int]:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(PilotFeedback.cohort, func.count()).group_by(PilotFeedback.cohort)
+        )
+        return dict(result.all())
+
+
+async def _seed_existing(
+    session_factory: async_sessionmaker[AsyncSession], cohorts: dict[str, int]
+) -> None:
+    async with session_factory() as session:
+        for cohort, count in cohorts.items():
+            session.add_all(PilotFeedback(cohort=cohort) for _ in range(count))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_apply_seed_inserts_across_batches(
+    seed_session_factory: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    batch_sizes: list[int] = []
+    original = PilotFeedbackService.record_feedback_bulk
+
+    async def spy(self, payloads, **kwargs):
+        payloads = list(payloads)
+        batch_sizes.append(len(payloads))
+        return await original(self, payloads, **kwargs)
+
+    monkeypatch.setattr(PilotFeedbackService, "record_feedback_bulk", spy)
+    entries = [{"cohort": "pilot-a", "sentiment_score": score} for score in range(1, 6)]
+
+    inserted, deleted = await seed_pilot_feedback._apply_seed(
+        entries, cohort_filter=None, replace=False, dry_run=False, batch_size=2
+    )
+
+    assert (inserted, deleted) == (5, 0)
+    assert batch_sizes == [2, 2, 1]
+    assert await _cohort_counts(seed_session_factory) == {"pilot-a": 5}
+
+
+@pytest.mark.asyncio
+async def test_apply_seed_replace_with_cohort_filter(
+    seed_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_existing(seed_session_factory, {"pilot-a": 3, "pilot-b": 2})
+    entries = [{"cohort": "pilot-a"}, {"cohort": "pilot-b"}, {"cohort": "pilot-a"}]
+
+    inserted, deleted = await seed_pilot_feedback._apply_seed(
+        entries, cohort_filter="pilot-a", replace=True, dry_run=False, batch_size=1
+    )
+
+    assert (inserted, deleted) == (2, 3)
+    assert await _cohort_counts(seed_session_factory) == {"pilot-a": 2, "pilot-b": 2}
+
+
+@pytest.mark.asyncio
+async def test_apply_seed_replace_purges_each_cohort_once(
+    seed_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_existing(seed_session_factory, {"pilot-a": 3, "pilot-b": 2, "pilot-c": 1})
+    entries = [{"cohort": "pilot-a"}, {"cohort": "pilot-b"}, {"cohort": "pilot-a"}]
+
+    inserted, deleted = await seed_pilot_feedback._apply_seed(
+        entries, cohort_filter=None, replace=True, dry_run=False, batch_size=1
+    )
+
+    assert (inserted, deleted) == (3, 5)
+    assert await _cohort_counts(seed_session_factory) == {
+        "pilot-a": 2,
+        "pilot-b": 1,
+        "pilot-c": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_apply_seed_dry_run_leaves_table_untouched(
+    seed_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_existing(seed_session_factory, {"pilot-a": 2})
+    entries = [{"cohort": "pilot-a"}, {"cohort": "pilot-b"}]
+
+    inserted, deleted = await seed_pilot_feedback._apply_seed(
+        entries, cohort_filter=None, replace=True, dry_run=True, batch_size=1
+    )
+
+    assert (inserted, deleted) == (2, 2)
+    assert await _cohort_counts(seed_session_factory) == {"pilot-a": 2}
+
+
+@pytest.mark.asyncio
+async def test_apply_seed_validation_error_commits_nothing(
+    seed_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_existing(seed_session_factory, {"pilot-a": 2})
+    entries = [
+        {"cohort": "pilot-a"},
+        {"cohort": "pilot-b"},
+        {"cohort": "pilot-b", "sentiment_score": 9},
+    ]
+
+    with pytest.raises(ValidationError):
+        await seed_pilot_feedback._apply_seed(
+            entries, cohort_filter=None, replace=True, dry_run=False, batch_size=1
+        )
+
+    assert await _cohort_counts(seed_session_factory) == {"pilot-a": 2}